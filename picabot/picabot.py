@@ -1,10 +1,38 @@
-import websockets, json, asyncio, logging, re
-from datetime import datetime
-from typing import Callable, Any, Dict, List, Optional
+import websockets, json, asyncio, logging, sys, time
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, Any, DefaultDict, Deque, Dict, List, Optional, Union
+
+try:
+  from websockets.asyncio.client import ClientConnection, connect as ws_connect
+except ImportError:
+  from websockets import WebSocketClientProtocol as ClientConnection
+  ws_connect = websockets.connect
+
+# websockets 14 added send(..., text=True), which sends UTF-8 bytes as a text frame
+_SEND_TEXT_BYTES = int(websockets.__version__.split(".")[0]) >= 14
+
+try:
+  import orjson
+  _loads = orjson.loads
+  _dumps = lambda obj: orjson.dumps(obj).decode()
+  _dumps_bytes = orjson.dumps
+except ImportError:
+  _loads = json.loads
+  _dumps = lambda obj: json.dumps(obj, ensure_ascii=False)
+  _dumps_bytes = lambda obj: json.dumps(obj, ensure_ascii=False).encode()
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_HAS_TASK_GROUP = sys.version_info >= (3, 11)
+
+_RECONNECT_WINDOW = 10.0
+_MAX_RECONNECT_ATTEMPTS = 5
+
+_CHAT_PREFIX = b'{"type":"chat","message":'
+_CHAT_SUFFIX = b'}'
+_REMOVE_MESSAGE_TEMPLATE = b'{"type":"removeMessage","messageId":%b,"channelId":%b}'
+
 class PicaBot:
   """
   A bot library for connecting and interacting with Picarto.tv chat websocket.
@@ -20,11 +48,28 @@ class PicaBot:
     self.uri = uri
     self.server = server
     self.prefix = command_prefix
-    self.ws: Optional[websockets.WebSocketClientProtocol] = None
-    self._listeners: Dict[str, List[Callable[..., Any]]] = {}
-    self._reconnection_attempts = []
+    self.ws: Optional[ClientConnection] = None
+    self._listeners: DefaultDict[str, List[Callable[..., Any]]] = defaultdict(list)
+    self._reconnection_attempts: Deque[float] = deque(maxlen=_MAX_RECONNECT_ATTEMPTS)
     self._commands: Dict[str, Callable[..., Any]] = {}
+    self._json_loads = _loads
+    self._json_dumps = _dumps
+    self._json_dumps_bytes = _dumps_bytes
+    self._frame_handlers: Dict[str, Callable[[dict], Awaitable[None]]] = {
+      "c": self._handle_chat_frame,
+    }
+    self._build_frame_markers()
     
+  @property
+  def prefix(self) -> str:
+    """The prefix that marks a chat message as a command."""
+    return self._prefix
+
+  @prefix.setter
+  def prefix(self, value: str):
+    self._prefix = value
+    self._prefix_len = len(value)
+
   @property
   def connected(self) -> bool:
       """Indicates whether the bot is currently connected to the server."""
@@ -37,16 +82,13 @@ class PicaBot:
     Returns:
       bool: True if reconnection is allowed, False otherwise.
     """
-    self._reconnection_attempts.append(datetime.now())
-    
-    for attempt in self._reconnection_attempts:
-      if (datetime.now() - attempt).seconds > 10:
-        self._reconnection_attempts.remove(attempt)
+    now = time.monotonic()
+    attempts = self._reconnection_attempts
+    while attempts and now - attempts[0] > _RECONNECT_WINDOW:
+      attempts.popleft()
+    attempts.append(now)
 
-    if len(self._reconnection_attempts) >= 5:
-      return False
-
-    return True
+    return len(attempts) < _MAX_RECONNECT_ATTEMPTS
   
   async def connect(self):
     """
@@ -57,7 +99,13 @@ class PicaBot:
     """
     while self._should_reconnect():
       try:
-        self.ws = await websockets.connect(self.uri)
+        self.ws = await ws_connect(
+          self.uri,
+          compression=None,
+          max_queue=16,
+          ping_interval=20,
+          ping_timeout=20
+        )
         logger.info(f"Connected to {self.server}")
         await self._listen()
       except KeyboardInterrupt:
@@ -95,57 +143,139 @@ class PicaBot:
     Returns:
        List[str]: A list of components of the message.
     """
-    matches = re.findall(r'"(.*?)"|(\S+)', message)
-    result = [m[0] if m[0] else m[1] for m in matches]
+    if '"' not in message:
+      return message.split()
+    result = []
+    i, n = 0, len(message)
+    while i < n:
+      if message[i].isspace():
+        i += 1
+        continue
+      if message[i] == '"':
+        end = message.find('"', i + 1)
+        if end != -1:
+          result.append(message[i + 1:end])
+          i = end + 1
+          continue
+      start = i
+      while i < n and not message[i].isspace():
+        i += 1
+      result.append(message[start:i])
     return result
   
-  async def _on_message(self, msg: str):
+  def _build_frame_markers(self):
+    """
+    Builds the substring markers used to skip frames of unhandled types before parsing.
+    """
+    self._frame_markers = tuple(
+      marker
+      for frame_type in self._frame_handlers
+      for marker in (f'"t":"{frame_type}"', f'"t": "{frame_type}"')
+    )
+    self._frame_markers_bytes = tuple(marker.encode() for marker in self._frame_markers)
+  
+  async def _on_message(self, msg: Union[str, bytes]):
     """
     Handles incoming messages and triggers appropriate events.
 
     Parameters:
-      msg (str): The raw message received from the WebSocket.
+      msg (Union[str, bytes]): The raw message received from the WebSocket.
     """
     if not msg:
       return
     
+    if isinstance(msg, str):
+      if msg[0] != "{":
+        return
+      markers = self._frame_markers
+    else:
+      if msg[:1] != b"{":
+        return
+      markers = self._frame_markers_bytes
+    
+    # Deliberate trade-off: frames that don't start with "{" are always dropped, and the
+    # marker check is a plain substring test, so frames with unusual spacing around the
+    # "t" key (e.g. `"t" : "c"`) are skipped unparsed. The chat server sends compact JSON.
+    # A "raw" listener only disables the marker test.
+    if not self._listeners.get("raw") and not any(marker in msg for marker in markers):
+      logger.debug("Skipping frame without a handled type: %r", msg)
+      return
+    
     try:
-      message = json.loads(msg)
+      message = self._json_loads(msg)
     except json.JSONDecodeError:
       logger.error(f"Failed to parse message: {msg}")
       return
     
     await self.emit("raw", message)
     
-    if message.get("t") == "c":
-      for part in message["m"]:
-        p_message = PicaMessage(part)
-        who = p_message.user_name
-        message = p_message.message
-        if who == self.bot_name:
-          continue
-        
-        if message.startswith(self.prefix):
-          command_name, *args = self._split_message(message[len(self.prefix):])
-          if command_name in self._commands:
-            await self._commands[command_name](p_message, *args)
+    handler = self._frame_handlers.get(message.get("t"))
+    if handler is not None:
+      await handler(message)
+  
+  async def _handle_chat_frame(self, message: dict):
+    """
+    Handles a chat frame, dispatching commands and emitting message events.
+
+    Parameters:
+      message (dict): The parsed chat frame.
+    """
+    bot_name = self.bot_name
+    prefix = self._prefix
+    prefix_len = self._prefix_len
+    commands = self._commands
+    emit = self.emit
+    split = self._split_message
+    PM = PicaMessage
+    for part in message["m"]:
+      if part["n"] == bot_name:
+        continue
+      p_message = PM(part)
+      text = p_message.message
+      
+      if text[:prefix_len] == prefix:
+        body = text[prefix_len:]
+        if '"' not in body:
+          head = body.split(None, 1)
+          handler = commands.get(head[0].casefold()) if head else None
+          if handler is not None:
+            await handler(p_message, *(head[1].split() if len(head) > 1 else ()))
+            continue
+        else:
+          parts = split(body)
+          handler = commands.get(parts[0].casefold()) if parts else None
+          if handler is not None:
+            await handler(p_message, *parts[1:])
             continue
 
-        await self.emit("message", p_message)
+      await emit("message", p_message)
   
-  async def send(self, message: dict):
+  async def send(self, message: Union[dict, str, bytes]):
     """
     Sends a message through the WebSocket connection.
 
     Parameters:
-      message (dict): The message to send as a dictionary.
+      message (Union[dict, str, bytes]): The message to send as a dictionary, 
+        or an already serialized JSON payload. Payloads are always sent as text frames,
+        so bytes must be UTF-8 encoded.
     
     Raises:
       ConnectionError: If not connected to the WebSocket server.
     """
     if self.ws is None:
       raise ConnectionError("Not connected")
-    await self.ws.send(json.dumps(message))
+    if isinstance(message, str):
+      await self.ws.send(message)
+    elif isinstance(message, bytes):
+      # bare bytes would go out as a binary frame; the chat server expects text frames
+      if _SEND_TEXT_BYTES:
+        await self.ws.send(message, text=True)
+      else:
+        await self.ws.send(message.decode())
+    elif _SEND_TEXT_BYTES:
+      await self.ws.send(self._json_dumps_bytes(message), text=True)
+    else:
+      await self.ws.send(self._json_dumps(message))
   
   async def send_message(self, message: str):
     """
@@ -157,10 +287,7 @@ class PicaBot:
     Raises:
       ConnectionError: If not connected to the WebSocket server.
     """
-    await self.send({
-      "type": "chat",
-      "message": message
-    })
+    await self.send(_CHAT_PREFIX + self._json_dumps_bytes(message) + _CHAT_SUFFIX)
     
   async def delete_message(self, message_id: str, channel_id: str):
     """
@@ -173,11 +300,8 @@ class PicaBot:
     Raises:
       ConnectionError: If not connected to the WebSocket server.
     """
-    await self.send({
-      "type": "removeMessage",
-      "messageId": message_id,
-      "channelId": channel_id
-    })
+    dumps = self._json_dumps_bytes
+    await self.send(_REMOVE_MESSAGE_TEMPLATE % (dumps(message_id), dumps(channel_id)))
 
   async def close(self):
     """
@@ -195,9 +319,36 @@ class PicaBot:
       args: Positional arguments to pass to the event listeners.
       kwargs: Keyword arguments to pass to the event listeners.
     """
-    if event_name in self._listeners:
-      tasks = [listener(*args, **kwargs) for listener in self._listeners[event_name]]
-      await asyncio.gather(*tasks)
+    listeners = self._listeners.get(event_name)
+    if not listeners:
+      return
+    if len(listeners) == 1:
+      await self._safe_call(event_name, listeners[0], args, kwargs)
+      return
+    if _HAS_TASK_GROUP:
+      async with asyncio.TaskGroup() as tg:
+        for listener in listeners:
+          tg.create_task(self._safe_call(event_name, listener, args, kwargs))
+    else:
+      await asyncio.gather(*[
+        self._safe_call(event_name, listener, args, kwargs) for listener in listeners
+      ])
+  
+  @staticmethod
+  async def _safe_call(event_name: str, listener: Callable[..., Any], args: tuple, kwargs: dict):
+    """
+    Awaits a single event listener, logging any exception instead of propagating it.
+
+    Parameters:
+      event_name (str): The name of the event being emitted.
+      listener (Callable[..., Any]): The listener to call.
+      args (tuple): Positional arguments to pass to the listener.
+      kwargs (dict): Keyword arguments to pass to the listener.
+    """
+    try:
+      await listener(*args, **kwargs)
+    except Exception:
+      logger.exception(f"Error in '{event_name}' listener")
   
   def event(self, event_name: str):
     """
@@ -207,21 +358,32 @@ class PicaBot:
       event_name (str): The name of the event to listen for.
     """
     def decorator(func):
-      if event_name not in self._listeners:
-        self._listeners[event_name] = []
       self._listeners[event_name].append(func)
       return func
     return decorator
   
   def command(self, name: str):
     """
-    Registers a command handler for a specific command.
+    Registers a command handler for a specific command. Command names are case-insensitive.
 
     Parameters:
-      event (str): The name of the event to listen for.
+      name (str): The name of the command, without the prefix.
     """
     def decorator(func):
-      self._commands[name] = func
+      self._commands[sys.intern(name.casefold())] = func
+      return func
+    return decorator
+  
+  def frame_handler(self, frame_type: str):
+    """
+    Registers a handler for a specific WebSocket frame type, replacing any existing one.
+
+    Parameters:
+      frame_type (str): The frame's "t" code, e.g. "c" for chat frames.
+    """
+    def decorator(func):
+      self._frame_handlers[frame_type] = func
+      self._build_frame_markers()
       return func
     return decorator
   
@@ -288,86 +450,44 @@ class PicaMessage:
   """ 
   PicaMessage is a class designed to encapsulate the details of a message received from the WebSocket. 
   It extracts and provides easy access to various attributes related to the message, the channel it was sent in, and the user who sent it.
+
+  Attributes:
+    channel_id (Optional[str]): The ID of the channel the message was sent in.
+    channel_name (Optional[str]): The name of the channel the message was sent in.
+    channel_color (Optional[str]): The username's color of the channel the message was sent in.
+    message_timestamp (Optional[int]): The Unix timestamp in milliseconds of the message.
+    message_id (Optional[str]): The ID of the message.
+    message (str): The contents of the message.
+    user_id (Optional[str]): The ID of the user who sent the message.
+    user_name (str): The username of the user who sent the message.
+    user_color (Optional[str]): The username's color of the user who sent the message.
+    user_profile_pic (Optional[str]): The URL of the user's profile picture.
+    data (dict): The raw message as received from the WebSocket.
   """
+  __slots__ = (
+    "channel_id",
+    "channel_name",
+    "channel_color",
+    "message_timestamp",
+    "message_id",
+    "message",
+    "user_id",
+    "user_name",
+    "user_color",
+    "user_profile_pic",
+    "data",
+  )
+
   def __init__(self, message: dict):
     self.data = message
-    
-  @property
-  def channel_id(self) -> str:
-    """
-    Returns:
-      str: The ID of the channel the message was sent in.
-    """
-    return self.data["c"]
-  
-  @property
-  def channel_name(self) -> str:
-    """
-    Returns:
-      str: The name of the channel the message was sent in.
-    """
-    return self.data["rn"]
-  
-  @property
-  def channel_color(self) -> str:
-    """
-    Returns:
-      str: The username's color of the channel the message was sent in.
-    """
-    return self.data["rc"]
-  
-  @property
-  def message_timestamp(self) -> int:
-    """
-    Returns:
-      int: The Unix timestamp in milliseconds of the message.
-    """
-    return int(self.data["a"])
-  
-  @property
-  def message_id(self) -> str:
-    """
-    Returns:
-      str: The ID of the message.
-    """
-    return self.data["id"]
-  
-  @property
-  def message(self) -> str:
-    """
-    Returns:
-      str: The contents of the message.
-    """
-    return self.data["m"]
-  
-  @property
-  def user_id(self) -> str:
-    """
-    Returns:
-      str: The ID of the user who sent the message.
-    """
-    return self.data["u"]
-  
-  @property
-  def user_name(self) -> str:
-    """
-    Returns:
-      str: The username of the user who sent the message.
-    """
-    return self.data["n"]
-  
-  @property
-  def user_color(self) -> str:
-    """
-    Returns:
-      str: The username's color of the user who sent the message.
-    """
-    return self.data["k"]
-  
-  @property
-  def user_profile_pic(self) -> str:
-    """
-    Returns:
-      str: The URL of the user's profile picture.
-    """
-    return self.data["i"]
+    self.channel_id: Optional[str] = message.get("c")
+    self.channel_name: Optional[str] = message.get("rn")
+    self.channel_color: Optional[str] = message.get("rc")
+    timestamp = message.get("a")
+    self.message_timestamp: Optional[int] = int(timestamp) if timestamp is not None else None
+    self.message_id: Optional[str] = message.get("id")
+    self.message: str = message["m"]
+    self.user_id: Optional[str] = message.get("u")
+    self.user_name: str = message["n"]
+    self.user_color: Optional[str] = message.get("k")
+    self.user_profile_pic: Optional[str] = message.get("i")